@@ -0,0 +1,294 @@
+"""
+Concurrent-session load test for the Streamlit collect/analyze/dashboard path.
+
+Streamlit runs every browser session as a thread in one process, so this
+harness does the same: N threads each play a session that clicks
+"Collect and Analyze" (render_sidebar, mocked collector, TextPreprocessor,
+per-row scoring as in app/main.py) and then rerenders the dashboard a few
+times (render_dashboard). Streamlit calls are stubbed out, plotly figures
+are still built. The model is a small numpy stand-in so the run works
+offline; raise --model-dim to make it heavier.
+
+Reports latency percentiles and throughput per operation, plus CPU time
+and memory per session. CPU is the whole process's user+system time
+divided by the number of sessions, so BLAS/torch worker threads count;
+per-thread CPU is shown alongside. The workload runs in fresh subprocesses with 1
+and with N sessions; per-session memory is the difference in peak RSS
+between the two, divided by the N - 1 extra sessions.
+
+Usage: python -m benchmarks.dashboard_load [--sessions 8] [--iterations 3]
+       [--rerenders 5] [--posts 100] [--model-dim 256]
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from app.componenets import dashboard, sidebar
+from pipelines.preprocessing import TextPreprocessor
+
+LABELS = ['positive', 'negative', 'neutral', 'sarcasm', 'frustration']
+WORDS = ("great terrible fine update release outage love hate support price "
+         "battery screen slow fast broken works again never always thanks").split()
+
+class _NullContext:
+    """Keeps nothing; usable as a `with` target like st.columns() results"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class StubStreamlit:
+    """
+    Stand-in for the `streamlit` module with per-thread session state.
+    Widgets return `widgets[label]` if given, else their defaults, and
+    every button is clicked.
+    """
+    def __init__(self, widgets: Dict = None):
+        self.widgets = widgets or {}
+        self._local = threading.local()
+
+    @property
+    def session_state(self) -> Dict:
+        if not hasattr(self._local, 'state'):
+            self._local.state = {}
+        return self._local.state
+
+    @property
+    def sidebar(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def columns(self, spec, **kwargs):
+        return [_NullContext() for _ in range(spec if isinstance(spec, int) else len(spec))]
+
+    def selectbox(self, label, options, index=0, **kwargs):
+        return self.widgets.get(label, options[index])
+
+    def text_input(self, label, value="", **kwargs):
+        return self.widgets.get(label, value)
+
+    def slider(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return self.widgets.get(label, value)
+
+    def toggle(self, label, value=False, **kwargs):
+        return self.widgets.get(label, value)
+
+    def checkbox(self, label, value=False, **kwargs):
+        return self.widgets.get(label, value)
+
+    def button(self, label, **kwargs):
+        return True
+
+    def __getattr__(self, name):
+        # Output calls (st.metric, st.plotly_chart, ...) drop their arguments
+        return lambda *args, **kwargs: _NullContext()
+
+class StubCollector:
+    """Mocked DataCollector returning synthetic Reddit-shaped posts"""
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def collect_reddit_posts(self, subreddits: List[str], limit: int = 100) -> pd.DataFrame:
+        # Simulated API round trip; sleeps release the GIL like real I/O
+        time.sleep(self.latency)
+        rng = np.random.default_rng()
+        now = datetime.now()
+        return pd.DataFrame({
+            'id': [str(i) for i in range(limit)],
+            'text': [' '.join(rng.choice(WORDS, 12)) for _ in range(limit)],
+            'created_at': [now - timedelta(hours=int(h)) for h in rng.integers(0, 144, limit)],
+            'upvotes': rng.integers(0, 1000, limit),
+            'comments': rng.integers(0, 100, limit),
+            'source': 'reddit'
+        })
+
+    def collect_twitter_posts(self, query: str, max_results: int = 100) -> pd.DataFrame:
+        df = self.collect_reddit_posts([query], max_results)
+        df['source'] = 'twitter'
+        return df.rename(columns={'upvotes': 'likes', 'comments': 'retweets'})
+
+class StubAnalyzer:
+    """Tiny hashed bag-of-words MLP with the SentimentAnalyzer interface"""
+    def __init__(self, dim: int = 256, vocab: int = 4096):
+        rng = np.random.default_rng(0)
+        self.vocab = vocab
+        self.w1 = rng.standard_normal((vocab, dim)).astype(np.float32)
+        self.w2 = rng.standard_normal((dim, len(LABELS))).astype(np.float32)
+
+    def get_top_sentiment(self, text: str) -> Dict:
+        x = np.zeros(self.vocab, dtype=np.float32)
+        for token in text.split():
+            # crc32 rather than hash(): str hashing is salted per process
+            x[zlib.crc32(token.encode()) % self.vocab] += 1
+        logits = np.maximum(x @ self.w1, 0) @ self.w2
+        probs = np.exp(logits - logits.max())
+        probs /= probs.sum()
+        top = int(probs.argmax())
+        return {'label': LABELS[top], 'score': float(probs[top])}
+
+def collect_and_analyze(st, collector, preprocessor, analyzer) -> pd.DataFrame:
+    """The "Collect and Analyze" click, mirroring app/main.py"""
+    params = sidebar.render_sidebar()['collection']
+    if params['source'] == "Reddit":
+        data = collector.collect_reddit_posts([params['query']], limit=params['limit'])
+    else:
+        data = collector.collect_twitter_posts(params['query'], max_results=params['limit'])
+
+    data = preprocessor.preprocess_data(data)
+    data['sentiment'] = data['cleaned_text'].apply(
+        lambda x: analyzer.get_top_sentiment(x)['label']
+    )
+    data['sentiment_score'] = data['cleaned_text'].apply(
+        lambda x: analyzer.get_top_sentiment(x)['score']
+    )
+    st.session_state['analysis_data'] = data
+    return data
+
+def run_session(st, collector, preprocessor, analyzer, iterations: int, rerenders: int) -> Dict:
+    """
+    Play one user session; returns per-operation latencies of successful
+    calls, thread CPU time and the first dashboard traceback if any
+    """
+    latencies = {'collect_and_analyze': [], 'render_dashboard': []}
+    errors = 0
+    first_error = None
+    cpu_start = time.thread_time()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        collect_and_analyze(st, collector, preprocessor, analyzer)
+        latencies['collect_and_analyze'].append(time.perf_counter() - start)
+
+        for _ in range(rerenders):
+            start = time.perf_counter()
+            try:
+                dashboard.render_dashboard(st.session_state['analysis_data'].copy())
+            except Exception:
+                errors += 1
+                first_error = first_error or traceback.format_exc()
+                continue
+            latencies['render_dashboard'].append(time.perf_counter() - start)
+
+    data = st.session_state['analysis_data']
+    return {
+        'latencies': latencies,
+        'errors': errors,
+        'first_error': first_error,
+        'cpu': time.thread_time() - cpu_start,
+        'state_bytes': int(data.memory_usage(deep=True).sum())
+    }
+
+def summarize(report: Dict, baseline_rss_mb: float):
+    results, wall = report['results'], report['wall']
+    sessions = len(results)
+    print(f"{sessions} sessions, {wall:.2f}s wall")
+    print(f"{'operation':<22}{'count':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}{'ops/s':>9}")
+    for op in ('collect_and_analyze', 'render_dashboard'):
+        samples = np.array([s for r in results for s in r['latencies'][op]]) * 1000
+        if not len(samples):
+            continue
+        p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+        print(f"{op:<22}{len(samples):>7}{p50:>10.1f}{p90:>10.1f}{p99:>10.1f}"
+              f"{samples.max():>10.1f}{len(samples) / wall:>9.1f}")
+
+    process_cpu = report['process_cpu']
+    thread_cpu = np.array([r['cpu'] for r in results])
+    state_mb = np.array([r['state_bytes'] for r in results]) / 2**20
+    print(f"CPU per session: {process_cpu / sessions:.2f}s process CPU "
+          f"({process_cpu / wall:.2f} cores busy on average); "
+          f"session threads alone mean {thread_cpu.mean():.2f}s, max {thread_cpu.max():.2f}s")
+
+    peak = report['peak_rss_mb']
+    print(f"Peak RSS: {baseline_rss_mb:.1f} MB with 1 session, {peak:.1f} MB with {sessions}")
+    if sessions > 1:
+        print(f"Memory per session: {(peak - baseline_rss_mb) / (sessions - 1):.1f} MB "
+              f"peak RSS per extra session, {state_mb.mean():.2f} MB session state")
+    else:
+        print(f"Memory per session: {state_mb.mean():.2f} MB session state")
+
+    errors = sum(r['errors'] for r in results)
+    if errors:
+        first_error = next(r['first_error'] for r in results if r['first_error'])
+        print(f"Dashboard render errors: {errors} (excluded from latencies), first one:")
+        print(first_error)
+
+def run_workload(args) -> Dict:
+    """Run all sessions in this process and return raw results, process CPU and peak RSS"""
+    st = StubStreamlit({"Number of posts": args.posts})
+    collector = StubCollector(args.collect_latency)
+    analyzer = StubAnalyzer(args.model_dim)
+    with patch('pipelines.preprocessing.AutoTokenizer.from_pretrained'):
+        preprocessor = TextPreprocessor()
+
+    with patch.object(sidebar, 'st', st), patch.object(dashboard, 'st', st):
+        usage_start = resource.getrusage(resource.RUSAGE_SELF)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+            futures = [
+                pool.submit(run_session, st, collector, preprocessor, analyzer,
+                            args.iterations, args.rerenders)
+                for _ in range(args.sessions)
+            ]
+            results = [f.result() for f in futures]
+        wall = time.perf_counter() - start
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    return {
+        'results': results,
+        'wall': wall,
+        'process_cpu': (usage.ru_utime - usage_start.ru_utime) + (usage.ru_stime - usage_start.ru_stime),
+        'peak_rss_mb': usage.ru_maxrss / 1024
+    }
+
+def run_child(args, sessions: int) -> Dict:
+    """Run the workload in a fresh interpreter so ru_maxrss starts clean"""
+    cmd = [sys.executable, '-m', 'benchmarks.dashboard_load', '--child',
+           '--sessions', str(sessions),
+           '--iterations', str(args.iterations),
+           '--rerenders', str(args.rerenders),
+           '--posts', str(args.posts),
+           '--model-dim', str(args.model_dim),
+           '--collect-latency', str(args.collect_latency)]
+    out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--iterations', type=int, default=3,
+                        help="Collect and Analyze clicks per session")
+    parser.add_argument('--rerenders', type=int, default=5,
+                        help="Dashboard rerenders after each click")
+    parser.add_argument('--posts', type=int, default=100)
+    parser.add_argument('--model-dim', type=int, default=256)
+    parser.add_argument('--collect-latency', type=float, default=0.2,
+                        help="Simulated collector API latency in seconds")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_workload(args)))
+        return
+
+    baseline = run_child(args, 1)
+    report = run_child(args, args.sessions) if args.sessions > 1 else baseline
+    summarize(report, baseline['peak_rss_mb'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Peak RSS of the pandas vs Arrow batch load paths in DataStorage.
+
+Writes a synthetic multi-month set of processed parquet files, then loads
+them once with the legacy pandas path (read_parquet + per-row columns +
+pd.concat) and once with DataStorage.batch_load_data. Each path runs in a
+fresh subprocess so ru_maxrss is not polluted by the other.
+
+Usage: python -m benchmarks.storage_rss [--files 90] [--rows 50000]
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+
+SENTIMENTS = ['positive', 'negative', 'neutral', 'sarcasm', 'frustration']
+TIME_RANGE = {'start': datetime(2000, 1, 1), 'end': datetime(2100, 1, 1)}
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def generate(directory: Path, files: int, rows: int):
+    """Write `files` daily sentiment snapshots of `rows` rows each"""
+    rng = np.random.default_rng(0)
+    start = datetime(2024, 1, 1)
+    for i in range(files):
+        df = pd.DataFrame({
+            'text': [f"post {i}-{j} " + "lorem ipsum " * 8 for j in range(rows)],
+            'sentiment': rng.choice(SENTIMENTS, rows),
+            'sentiment_score': rng.random(rows),
+            'upvotes': rng.integers(0, 1000, rows),
+            'created_at': pd.Timestamp(start + timedelta(days=i)),
+        })
+        source = 'reddit' if i % 2 else 'twitter'
+        ts = (start + timedelta(days=i)).strftime('%Y%m%d_%H%M%S')
+        df.to_parquet(directory / f"{source}_sentiment_{ts}.parquet", engine='pyarrow')
+
+def load_pandas(directory: Path) -> pd.DataFrame:
+    """The original batch_load_data implementation"""
+    frames = []
+    for file in directory.glob("*.parquet"):
+        file_ts = datetime.strptime('_'.join(file.stem.split('_')[-2:]), '%Y%m%d_%H%M%S')
+        df = pd.read_parquet(file)
+        df['data_source'] = file.stem.split('_')[0]
+        df['collection_time'] = file_ts
+        frames.append(df)
+    data = pd.concat(frames, ignore_index=True)
+    return data[data['sentiment_score'] >= 0.9]
+
+def load_arrow(directory: Path) -> pd.DataFrame:
+    from services.storage import DataStorage
+    with patch('services.storage.PROCESSED_DATA_DIR', directory), \
+         patch('services.storage.RAW_DATA_DIR', directory):
+        storage = DataStorage()
+    return storage.batch_load_data(TIME_RANGE, filter_expr=pc.field('sentiment_score') >= 0.9)
+
+def run_child(mode: str, directory: Path):
+    baseline = peak_rss_mb()
+    data = (load_pandas if mode == 'pandas' else load_arrow)(Path(directory))
+    print(f"{len(data)} {baseline:.1f} {peak_rss_mb():.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--files', type=int, default=90)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--child', choices=['pandas', 'arrow'])
+    parser.add_argument('--dir')
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.dir)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        generate(directory, args.files, args.rows)
+        on_disk = sum(f.stat().st_size for f in directory.glob("*.parquet")) / 2**20
+        print(f"{args.files} files x {args.rows} rows, {on_disk:.1f} MB on disk")
+
+        for mode in ('pandas', 'arrow'):
+            out = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.storage_rss', '--child', mode, '--dir', tmp],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            rows, baseline, peak = int(out[0]), float(out[1]), float(out[2])
+            print(f"{mode:>7}: {rows} rows kept, peak RSS {peak:.1f} MB "
+                  f"(+{peak - baseline:.1f} MB over import baseline)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+import os
+
+# Model SentimentAnalyzer loads by default: a hub id, or a directory written by
+# DistillationTrainer.save_student to score with the compact student.
+# Unset means the fine-tuned teacher (MODEL_NAME).
+SENTIMENT_MODEL = os.getenv("SENTIMENT_MODEL")
@@ -0,0 +1,277 @@
+import argparse
+import copy
+import logging
+import random
+import re
+import statistics
+import time
+import pandas as pd
+import pyarrow as pa
+import torch
+import torch.nn.functional as F
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from transformers import AutoTokenizer, RobertaForSequenceClassification
+from config.settings import MODEL_NAME
+from services.storage import DataStorage
+
+logger = logging.getLogger(__name__)
+
+class DistillationTrainer:
+    """
+    Distils the fine-tuned RoBERTa teacher into a compact student with the
+    same tokenizer and a few transformer layers. The student is a regular
+    RobertaForSequenceClassification, so a saved student directory can be
+    passed to `SentimentAnalyzer(model_name=...)` or set as the
+    SENTIMENT_MODEL setting.
+    """
+
+    def __init__(self,
+                 teacher_name: str = MODEL_NAME,
+                 num_layers: int = 2,
+                 temperature: float = 2.0,
+                 max_length: int = 128):
+        self.tokenizer = AutoTokenizer.from_pretrained(teacher_name)
+        self.teacher = RobertaForSequenceClassification.from_pretrained(teacher_name)
+        self.teacher.eval()
+        self.temperature = temperature
+        self.max_length = max_length
+        self.student = self.build_student(num_layers)
+
+    def build_student(self, num_layers: int) -> RobertaForSequenceClassification:
+        """
+        Student with `num_layers` encoder layers, initialised from the
+        teacher's embeddings, classifier and evenly spaced encoder layers
+        """
+        teacher_layers = self.teacher.config.num_hidden_layers
+        if not 0 < num_layers <= teacher_layers:
+            raise ValueError(f"num_layers must be between 1 and {teacher_layers}")
+
+        config = copy.deepcopy(self.teacher.config)
+        config.num_hidden_layers = num_layers
+        student = RobertaForSequenceClassification(config)
+
+        if num_layers == 1:
+            keep = [teacher_layers - 1]
+        else:
+            keep = [round(i * (teacher_layers - 1) / (num_layers - 1)) for i in range(num_layers)]
+        layer_map = {teacher_idx: student_idx for student_idx, teacher_idx in enumerate(keep)}
+
+        state = {}
+        for key, value in self.teacher.state_dict().items():
+            match = re.search(r'\.encoder\.layer\.(\d+)\.', key)
+            if match is None:
+                state[key] = value
+            elif int(match.group(1)) in layer_map:
+                new_idx = layer_map[int(match.group(1))]
+                state[key.replace(match.group(0), f'.encoder.layer.{new_idx}.', 1)] = value
+        student.load_state_dict(state)
+        return student
+
+    def load_corpus(self, sources: Optional[List[str]] = None) -> List[str]:
+        """
+        Texts from every stored, already-analyzed data file. Only the
+        `cleaned_text`/`text` columns are read; `cleaned_text` is what the
+        app scores, so raw `text` is used only for files saved without it,
+        with a warning.
+        """
+        storage = DataStorage()
+        time_range = {'start': datetime.min, 'end': datetime.max}
+        # Files lacking a column come back as nulls; the projection itself
+        # only fails for a column that no stored file has
+        for columns in (['cleaned_text', 'text'], ['cleaned_text'], ['text']):
+            try:
+                data = storage.batch_load_data(time_range, sources, columns=columns)
+                break
+            except (pa.ArrowInvalid, KeyError):
+                continue
+        else:
+            return []
+        if data.empty:
+            return []
+        
+        missing = pd.Series(None, index=data.index, dtype=object)
+        cleaned = data['cleaned_text'] if 'cleaned_text' in data.columns else missing
+        raw = data['text'] if 'text' in data.columns else missing
+        fallback = cleaned.isna() & raw.notna()
+        if fallback.any():
+            logger.warning(
+                "%d of %d stored texts have no cleaned_text (sources: %s); using raw text for them",
+                fallback.sum(), len(data), ', '.join(sorted(data.loc[fallback, 'data_source'].unique()))
+            )
+        return cleaned.fillna(raw).dropna().astype(str).tolist()
+
+    def _encode(self, texts: List[str]) -> Dict[str, torch.Tensor]:
+        return self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="pt"
+        )
+
+    @torch.inference_mode()
+    def _logits(self, model, texts: List[str], batch_size: int) -> torch.Tensor:
+        model.eval()
+        batches = [
+            model(**self._encode(texts[i:i + batch_size])).logits
+            for i in range(0, len(texts), batch_size)
+        ]
+        return torch.cat(batches)
+
+    def _timed_predictions(self,
+                           model,
+                           texts: List[str],
+                           batch_size: int,
+                           repeats: int) -> Tuple[torch.Tensor, float]:
+        """Predicted classes and median wall time over `repeats` passes, after a warm-up batch"""
+        self._logits(model, texts[:batch_size], batch_size)
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            predictions = self._logits(model, texts, batch_size).argmax(dim=-1)
+            timings.append(time.perf_counter() - start)
+        return predictions, statistics.median(timings)
+
+    def soft_labels(self, texts: List[str], batch_size: int = 32) -> torch.Tensor:
+        """Teacher class probabilities softened by the distillation temperature"""
+        return F.softmax(self._logits(self.teacher, texts, batch_size) / self.temperature, dim=-1)
+
+    def train(self,
+              texts: List[str],
+              epochs: int = 3,
+              batch_size: int = 32,
+              learning_rate: float = 5e-5) -> List[float]:
+        """
+        Fit the student to the teacher's soft probabilities with the
+        temperature-scaled KL loss of Hinton et al.
+        Returns:
+            Mean loss per epoch
+        """
+        if not texts:
+            raise ValueError("No texts to distil on")
+
+        targets = self.soft_labels(texts, batch_size)
+        optimizer = torch.optim.AdamW(self.student.parameters(), lr=learning_rate)
+        history = []
+
+        for _ in range(epochs):
+            self.student.train()
+            order = torch.randperm(len(texts)).tolist()
+            total = 0.0
+            for i in range(0, len(order), batch_size):
+                idx = order[i:i + batch_size]
+                logits = self.student(**self._encode([texts[j] for j in idx])).logits
+                loss = F.kl_div(
+                    F.log_softmax(logits / self.temperature, dim=-1),
+                    targets[idx],
+                    reduction='batchmean'
+                ) * self.temperature ** 2
+                optimizer.zero_grad()
+                loss.backward()
+                optimizer.step()
+                total += loss.item() * len(idx)
+            history.append(total / len(texts))
+
+        self.student.eval()
+        return history
+
+    def evaluate(self, texts: List[str], batch_size: int = 32, repeats: int = 3) -> Dict:
+        """
+        Compare student against teacher on held-out `texts`
+        Returns:
+            Overall and per-class agreement (grouped by the teacher's label,
+            e.g. how often the student also says sarcasm when the teacher
+            does), plus scoring throughput of both models
+        """
+        teacher_pred, teacher_time = self._timed_predictions(self.teacher, texts, batch_size, repeats)
+        student_pred, student_time = self._timed_predictions(self.student, texts, batch_size, repeats)
+
+        agree = teacher_pred == student_pred
+        per_class = {}
+        for idx, label in self.teacher.config.id2label.items():
+            mask = teacher_pred == int(idx)
+            support = int(mask.sum())
+            per_class[label] = {
+                'support': support,
+                'agreement': float(agree[mask].float().mean()) if support else None
+            }
+
+        return {
+            'agreement': float(agree.float().mean()),
+            'per_class': per_class,
+            'teacher_texts_per_sec': len(texts) / teacher_time,
+            'student_texts_per_sec': len(texts) / student_time,
+            'speedup': teacher_time / student_time,
+            'teacher_params': sum(p.numel() for p in self.teacher.parameters()),
+            'student_params': sum(p.numel() for p in self.student.parameters())
+        }
+
+    def save_student(self, output_dir: Path) -> Path:
+        """Save student and tokenizer in a directory SentimentAnalyzer can load"""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.student.save_pretrained(output_dir)
+        self.tokenizer.save_pretrained(output_dir)
+        return output_dir
+
+def format_report(report: Dict) -> str:
+    """Plain-text table of an `evaluate` report"""
+    lines = [f"{'class':<14}{'support':>9}{'agreement':>11}"]
+    for label, stats in report['per_class'].items():
+        agreement = f"{stats['agreement']:.1%}" if stats['agreement'] is not None else "n/a"
+        lines.append(f"{label:<14}{stats['support']:>9}{agreement:>11}")
+    lines.append(f"{'overall':<14}{sum(c['support'] for c in report['per_class'].values()):>9}"
+                 f"{report['agreement']:>11.1%}")
+    lines.append(
+        f"Throughput: teacher {report['teacher_texts_per_sec']:.1f} texts/s, "
+        f"student {report['student_texts_per_sec']:.1f} texts/s ({report['speedup']:.1f}x), "
+        f"params {report['teacher_params']:,} -> {report['student_params']:,}"
+    )
+    return '\n'.join(lines)
+
+def distill(output_dir: Path,
+            teacher_name: str = MODEL_NAME,
+            num_layers: int = 2,
+            sources: Optional[List[str]] = None,
+            eval_fraction: float = 0.2,
+            epochs: int = 3,
+            batch_size: int = 32,
+            seed: int = 0) -> Dict:
+    """
+    Full workflow: load the stored corpus, hold out `eval_fraction` of it,
+    train the student on the rest, evaluate on the held-out texts and save
+    the student to `output_dir`
+    Returns:
+        The `evaluate` report
+    """
+    random.seed(seed)
+    torch.manual_seed(seed)
+    trainer = DistillationTrainer(teacher_name, num_layers=num_layers)
+
+    texts = trainer.load_corpus(sources)
+    random.shuffle(texts)
+    n_eval = max(1, int(len(texts) * eval_fraction))
+    if len(texts) <= n_eval:
+        raise ValueError(f"Need more than {n_eval} stored texts to hold out an evaluation split")
+    eval_texts, train_texts = texts[:n_eval], texts[n_eval:]
+
+    trainer.train(train_texts, epochs=epochs, batch_size=batch_size)
+    report = trainer.evaluate(eval_texts, batch_size=batch_size)
+    trainer.save_student(output_dir)
+    return report
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Distil the sentiment teacher into a compact student")
+    parser.add_argument('output_dir', type=Path)
+    parser.add_argument('--teacher', default=MODEL_NAME)
+    parser.add_argument('--layers', type=int, default=2)
+    parser.add_argument('--sources', nargs='*')
+    parser.add_argument('--eval-fraction', type=float, default=0.2)
+    parser.add_argument('--epochs', type=int, default=3)
+    args = parser.parse_args()
+
+    report = distill(args.output_dir, args.teacher, args.layers, args.sources,
+                     args.eval_fraction, args.epochs)
+    print(format_report(report))
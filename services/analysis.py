@@ -0,0 +1,50 @@
+import transformers
+from collections import Counter
+from config.settings import MODEL_NAME, SENTIMENT_MODEL
+from typing import Dict, List, Optional
+
+class SentimentAnalyzer:
+    """Sentiment/emotion prediction with a fine-tuned RoBERTa model"""
+
+    def __init__(self, model_name: Optional[str] = None, max_length: int = 128):
+        """
+        Args:
+            model_name: Hub id or local directory of the model to load.
+                Defaults to the SENTIMENT_MODEL setting, else MODEL_NAME.
+                A directory written by `DistillationTrainer.save_student`
+                scores with the compact student instead of the teacher.
+            max_length: Maximum tokens per text
+        """
+        model_name = model_name or SENTIMENT_MODEL or MODEL_NAME
+        self.model_name = model_name
+        self.tokenizer = transformers.AutoTokenizer.from_pretrained(model_name)
+        self.model = transformers.RobertaForSequenceClassification.from_pretrained(model_name)
+        self.model.eval()
+        self.classifier = transformers.pipeline(
+            "text-classification",
+            model=self.model,
+            tokenizer=self.tokenizer,
+            top_k=None,
+            truncation=True,
+            max_length=max_length
+        )
+
+    def analyze_sentiment(self, text: str) -> List[Dict]:
+        """Scores for every class as [{'label': ..., 'score': ...}, ...]"""
+        scores = self.classifier(text)
+        # Some transformers versions wrap a single input's scores in a list
+        if scores and isinstance(scores[0], list):
+            scores = scores[0]
+        return scores
+
+    def get_top_sentiment(self, text: str) -> Dict:
+        """Highest scoring class for a single text"""
+        return max(self.analyze_sentiment(text), key=lambda r: r['score'])
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """Top class for each text"""
+        return [self.get_top_sentiment(text) for text in texts]
+
+    def get_sentiment_distribution(self, texts: List[str]) -> Dict[str, int]:
+        """Count of top classes across texts"""
+        return dict(Counter(self.get_top_sentiment(text)['label'] for text in texts))
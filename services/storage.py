@@ -1,10 +1,14 @@
+import numpy as np
 import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
 import pyarrow as pa
 from pathlib import Path
 from datetime import datetime
 from config.settings import PROCESSED_DATA_DIR, RAW_DATA_DIR
-from typing import Union, Optional, Dict, List
+from typing import Union, Optional, Dict, List, Any
 
 class DataStorage:
     """Handles persistent data storage and retrieval"""
@@ -62,58 +66,232 @@ class DataStorage:
         )
         return filepath
     
-    def load_latest_data(self, 
-                        source: str, 
-                        processed: bool = True) -> Optional[pd.DataFrame]:
+    def load_latest_table(self,
+                          source: str,
+                          processed: bool = True,
+                          columns: Optional[List[str]] = None,
+                          filter_expr: Optional[pc.Expression] = None) -> Optional[pa.Table]:
         """
-        Load most recent data file for a given source
+        Load most recent data file for a given source as an Arrow table
         Args:
             source: Data source identifier
             processed: Whether to load processed or raw data
+            columns: Optional subset of columns to read
+            filter_expr: Optional row filter, e.g. pc.field('sentiment') == 'negative'
         Returns:
-            DataFrame if found, else None
+            Memory-mapped Arrow table if found, else None
         """
         directory = self.processed_dir if processed else self.raw_dir
         pattern = f"{source}_*.parquet"
         files = sorted(directory.glob(pattern), key=lambda f: f.stat().st_mtime, reverse=True)
         
         if files:
-            return pd.read_parquet(files[0])
+            return self._read_table(files[0], columns, filter_expr)
         return None
     
-    def batch_load_data(self, 
-                       time_range: Dict[str, datetime] = None, 
-                       sources: List[str] = None) -> pd.DataFrame:
+    def load_latest_data(self, 
+                        source: str, 
+                        processed: bool = True,
+                        columns: Optional[List[str]] = None,
+                        filter_expr: Optional[pc.Expression] = None) -> Optional[pd.DataFrame]:
         """
-        Load multiple data files matching criteria
+        Load most recent data file for a given source
+        Args:
+            source: Data source identifier
+            processed: Whether to load processed or raw data
+            columns: Optional subset of columns to read
+            filter_expr: Optional Arrow row filter applied before conversion
+        Returns:
+            DataFrame if found, else None
+        """
+        table = self.load_latest_table(source, processed, columns, filter_expr)
+        if table is not None:
+            return self._to_pandas(table)
+        return None
+    
+    def batch_load_table(self,
+                         time_range: Dict[str, datetime] = None,
+                         sources: List[str] = None,
+                         columns: Optional[List[str]] = None,
+                         filter_expr: Optional[pc.Expression] = None) -> pa.Table:
+        """
+        Load multiple data files matching criteria without leaving Arrow
         Args:
             time_range: {'start': datetime, 'end': datetime}
             sources: List of source identifiers to include
+            columns: Optional subset of file columns to read
+            filter_expr: Optional row filter, e.g. pc.field('sentiment') == 'negative'.
+                May use columns outside `columns`, `data_source` and
+                `collection_time`; columns a file lacks evaluate as null.
         Returns:
-            Concatenated DataFrame
+            Concatenated Arrow table with dictionary-encoded
+            `data_source`/`collection_time` columns
         """
-        frames = []
+        matches = []
         search_dir = self.processed_dir if time_range else self.raw_dir
         
         for file in search_dir.glob("*.parquet"):
-            file_ts = datetime.strptime(file.stem.split('_')[-1], '%Y%m%d_%H%M%S')
+            file_ts = self._parse_file_timestamp(file)
             
             # Filter by time range if specified
             if time_range and not (time_range['start'] <= file_ts <= time_range['end']):
                 continue
             
             # Filter by source if specified
-            if sources and file.stem.split('_')[0] not in sources:
+            source = file.stem.split('_')[0]
+            if sources and source not in sources:
                 continue
             
-            df = pd.read_parquet(file)
-            df['data_source'] = file.stem.split('_')[0]
-            df['collection_time'] = file_ts
-            frames.append(df)
+            matches.append((file, source, file_ts))
+        
+        if not matches:
+            return pa.table({})
+        
+        # Footer-only reads; every file is scanned against the unified schema
+        # so missing columns come back as nulls and types are upcast
+        schema = self._unify_schemas([pq.read_schema(file) for file, _, _ in matches])
+        scan_schema = schema.append(pa.field('data_source', pa.string())) \
+                            .append(pa.field('collection_time', pa.timestamp('us')))
+        scan_columns = columns if columns is not None else schema.names
+        
+        tables = []
+        for file, source, file_ts in matches:
+            table = self._scan_file(file, scan_schema, scan_columns, filter_expr, source, file_ts)
+            table = table.append_column(
+                'data_source', self._constant_column(source, table.num_rows, pa.string()))
+            table = table.append_column(
+                'collection_time', self._constant_column(file_ts, table.num_rows, pa.timestamp('us')))
+            tables.append(table)
+        
+        # concat_tables only stitches chunk lists together, no buffers are copied
+        return pa.concat_tables(tables)
+    
+    def batch_load_data(self, 
+                       time_range: Dict[str, datetime] = None, 
+                       sources: List[str] = None,
+                       columns: Optional[List[str]] = None,
+                       filter_expr: Optional[pc.Expression] = None) -> pd.DataFrame:
+        """
+        Load multiple data files matching criteria
+        Args:
+            time_range: {'start': datetime, 'end': datetime}
+            sources: List of source identifiers to include
+            columns: Optional subset of file columns to read
+            filter_expr: Optional Arrow row filter applied before conversion
+        Returns:
+            Concatenated DataFrame
+        """
+        table = self.batch_load_table(time_range, sources, columns, filter_expr)
+        if table.num_columns == 0:
+            return pd.DataFrame()
+        
+        # Only the filtered slice is materialised; expand the constant-column
+        # dictionaries so callers keep plain string/datetime columns
+        for name, value_type in (('data_source', pa.string()), ('collection_time', pa.timestamp('us'))):
+            idx = table.schema.get_field_index(name)
+            table = table.set_column(
+                idx, name,
+                pa.chunked_array(
+                    [chunk.dictionary_decode() for chunk in table.column(idx).chunks],
+                    type=value_type
+                )
+            )
+        return self._to_pandas(table)
+    
+    @staticmethod
+    def _read_table(path: Path,
+                    columns: Optional[List[str]] = None,
+                    filter_expr: Optional[pc.Expression] = None) -> pa.Table:
+        """Read a parquet file through a memory map instead of heap buffers"""
+        return pq.read_table(path, columns=columns, filters=filter_expr, memory_map=True)
+    
+    @staticmethod
+    def _scan_file(path: Path,
+                   schema: pa.Schema,
+                   columns: List[str],
+                   filter_expr: Optional[pc.Expression],
+                   source: str,
+                   file_ts: datetime) -> pa.Table:
+        """
+        Memory-mapped scan of one file against `schema`, with the file's
+        source and timestamp known to the filter as partition values so
+        predicates on them skip the file without reading it
+        """
+        dataset = ds.FileSystemDataset.from_paths(
+            [str(path.resolve())],
+            schema=schema,
+            format=ds.ParquetFileFormat(),
+            filesystem=pafs.LocalFileSystem(use_mmap=True),
+            partitions=[
+                (pc.field('data_source') == source)
+                & (pc.field('collection_time') == pa.scalar(file_ts, type=pa.timestamp('us')))
+            ]
+        )
+        return dataset.to_table(columns=columns, filter=filter_expr)
+    
+    @staticmethod
+    def _to_pandas(table: pa.Table) -> pd.DataFrame:
+        """Convert to pandas, releasing Arrow buffers column by column"""
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    @staticmethod
+    def _parse_file_timestamp(path: Path) -> datetime:
+        """Extract the `%Y%m%d_%H%M%S` suffix written by the save methods"""
+        return datetime.strptime('_'.join(path.stem.split('_')[-2:]), '%Y%m%d_%H%M%S')
+    
+    @staticmethod
+    def _constant_column(value: Any, length: int, value_type: pa.DataType) -> pa.DictionaryArray:
+        """Single-entry dictionary column: one byte per row instead of a full value"""
+        indices = pa.array(np.zeros(length, dtype=np.int8))
+        return pa.DictionaryArray.from_arrays(indices, pa.array([value], type=value_type))
+    
+    @staticmethod
+    def _promote_types(types: List[pa.DataType]) -> pa.DataType:
+        """
+        Common type for a column across files. Numbers upcast the way
+        pd.concat does, timestamps take the finest unit (mixed timezones,
+        including naive values, become UTC), and any other conflict falls
+        back to text so no file fails to load.
+        """
+        distinct = [t for t in dict.fromkeys(types) if not pa.types.is_null(t)]
+        if not distinct:
+            return pa.null()
+        if len(distinct) == 1:
+            return distinct[0]
+        if all(pa.types.is_integer(t) or pa.types.is_boolean(t) for t in distinct):
+            return pa.int64()
+        if all(pa.types.is_integer(t) or pa.types.is_floating(t) or pa.types.is_boolean(t)
+               for t in distinct):
+            return pa.float64()
+        if all(pa.types.is_timestamp(t) for t in distinct):
+            unit = max((t.unit for t in distinct), key=['s', 'ms', 'us', 'ns'].index)
+            timezones = {t.tz for t in distinct}
+            return pa.timestamp(unit, tz=timezones.pop() if len(timezones) == 1 else 'UTC')
+        if any(pa.types.is_large_string(t) for t in distinct):
+            return pa.large_string()
+        return pa.string()
+    
+    @classmethod
+    def _unify_schemas(cls, schemas: List[pa.Schema]) -> pa.Schema:
+        """
+        One schema covering every file's columns, minus the index columns
+        pandas wrote (they were dropped by ignore_index before)
+        """
+        index_columns = set()
+        for schema in schemas:
+            metadata = schema.pandas_metadata or {}
+            index_columns.update(c for c in metadata.get('index_columns', []) if isinstance(c, str))
         
-        if frames:
-            return pd.concat(frames, ignore_index=True)
-        return pd.DataFrame()
+        names = [
+            name for name in dict.fromkeys(n for schema in schemas for n in schema.names)
+            if name not in index_columns
+        ]
+        return pa.schema([
+            pa.field(name, cls._promote_types(
+                [s.field(name).type for s in schemas if name in s.names]
+            ))
+            for name in names
+        ])
 
     def get_available_sources(self) -> List[str]:
         """List all unique data sources available"""
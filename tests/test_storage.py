@@ -0,0 +1,148 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from services.storage import DataStorage
+
+class TestDataStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        with patch('services.storage.RAW_DATA_DIR', root / 'raw'), \
+             patch('services.storage.PROCESSED_DATA_DIR', root / 'processed'):
+            self.storage = DataStorage()
+
+        self.reddit_df = pd.DataFrame({
+            'text': ['Great update', 'Worst release ever', 'It is fine'],
+            'sentiment': ['positive', 'frustration', 'neutral'],
+            'sentiment_score': [0.9, 0.8, 0.6],
+            'upvotes': [10, 3, 1]
+        })
+        self.twitter_df = pd.DataFrame({
+            'text': ['Oh great, another outage'],
+            'sentiment': ['sarcasm'],
+            'sentiment_score': [0.7],
+            'likes': [5]
+        })
+        self._write(self.reddit_df, 'reddit_sentiment_20240101_120000.parquet', 1)
+        self._write(self.twitter_df, 'twitter_sentiment_20240102_080000.parquet', 2)
+        self.time_range = {'start': datetime(2024, 1, 1), 'end': datetime(2024, 1, 31)}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, df, name, mtime):
+        path = self.storage.processed_dir / name
+        df.to_parquet(path, engine='pyarrow')
+        os.utime(path, (mtime, mtime))
+
+    def test_load_latest_data(self):
+        result = self.storage.load_latest_data('reddit')
+        pd.testing.assert_frame_equal(result, self.reddit_df)
+
+    def test_load_latest_data_filters(self):
+        result = self.storage.load_latest_data(
+            'reddit',
+            columns=['text', 'sentiment_score'],
+            filter_expr=pc.field('sentiment_score') > 0.7
+        )
+        self.assertEqual(list(result.columns), ['text', 'sentiment_score'])
+        self.assertEqual(list(result['text']), ['Great update', 'Worst release ever'])
+
+    def test_load_latest_table(self):
+        table = self.storage.load_latest_table('twitter', columns=['text'])
+        self.assertIsInstance(table, pa.Table)
+        self.assertEqual(table.column_names, ['text'])
+        self.assertIsNone(self.storage.load_latest_table('missing'))
+
+    def test_batch_load_table_encodes_constant_columns(self):
+        table = self.storage.batch_load_table(self.time_range)
+        self.assertEqual(table.num_rows, 4)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('data_source').type))
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('collection_time').type))
+
+    def test_batch_load_data(self):
+        result = self.storage.batch_load_data(self.time_range)
+        self.assertEqual(len(result), 4)
+        self.assertEqual(list(result.index), [0, 1, 2, 3])
+        self.assertEqual(set(result['data_source']), {'reddit', 'twitter'})
+        self.assertFalse(isinstance(result['data_source'].dtype, pd.CategoricalDtype))
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(result['collection_time']))
+        # Columns missing from one source are padded with nulls
+        self.assertEqual(result['likes'].isna().sum(), 3)
+
+    def test_batch_load_data_filters(self):
+        result = self.storage.batch_load_data(
+            self.time_range,
+            sources=['reddit'],
+            columns=['text', 'sentiment_score'],
+            filter_expr=pc.field('sentiment_score') >= 0.7
+        )
+        self.assertEqual(len(result), 2)
+        self.assertEqual(set(result['data_source']), {'reddit'})
+        self.assertNotIn('upvotes', result.columns)
+
+    def test_batch_load_data_promotes_mixed_types(self):
+        # upvotes is int64 here but float64 in a file with a missing value
+        mixed = self.reddit_df.assign(upvotes=[4, None, 2])
+        self._write(mixed, 'reddit_sentiment_20240103_090000.parquet', 3)
+        result = self.storage.batch_load_data(self.time_range, sources=['reddit'])
+        self.assertEqual(len(result), 6)
+        self.assertEqual(result['upvotes'].dtype, 'float64')
+        self.assertEqual(result['upvotes'].isna().sum(), 1)
+
+    def test_batch_load_data_projects_columns_missing_in_some_files(self):
+        # reddit files have upvotes, twitter files have likes
+        result = self.storage.batch_load_data(
+            self.time_range,
+            columns=['text', 'upvotes'],
+            filter_expr=pc.field('likes') > 1
+        )
+        self.assertEqual(list(result['text']), ['Oh great, another outage'])
+        self.assertTrue(result['upvotes'].isna().all())
+
+    def test_batch_load_data_filters_on_unprojected_columns(self):
+        result = self.storage.batch_load_data(
+            self.time_range,
+            columns=['text'],
+            filter_expr=(pc.field('sentiment') == 'sarcasm') | (pc.field('data_source') == 'reddit')
+        )
+        self.assertEqual(len(result), 4)
+        self.assertEqual(list(result.columns), ['text', 'data_source', 'collection_time'])
+
+    def test_batch_load_data_unifies_timezones(self):
+        naive = self.reddit_df.assign(created_at=pd.to_datetime(['2024-01-01'] * 3))
+        aware = self.twitter_df.assign(created_at=pd.to_datetime(['2024-01-02']).tz_localize('UTC'))
+        self._write(naive, 'reddit_sentiment_20240101_120000.parquet', 1)
+        self._write(aware, 'twitter_sentiment_20240102_080000.parquet', 2)
+        result = self.storage.batch_load_data(self.time_range)
+        self.assertEqual(str(result['created_at'].dt.tz), 'UTC')
+        self.assertEqual(result['created_at'].isna().sum(), 0)
+
+    def test_batch_load_data_falls_back_to_text_on_conflicts(self):
+        self._write(self.reddit_df.assign(extra=['a', 'b', 'c']),
+                    'reddit_sentiment_20240101_120000.parquet', 1)
+        self._write(self.twitter_df.assign(extra=pd.to_datetime(['2024-01-02'])),
+                    'twitter_sentiment_20240102_080000.parquet', 2)
+        result = self.storage.batch_load_data(self.time_range)
+        self.assertEqual(len(result), 4)
+        self.assertTrue(all(isinstance(v, str) for v in result['extra']))
+
+    def test_batch_load_data_drops_pandas_index(self):
+        filtered = self.reddit_df[self.reddit_df['sentiment_score'] > 0.7]
+        self._write(filtered, 'reddit_sentiment_20240101_120000.parquet', 1)
+        result = self.storage.batch_load_data(self.time_range)
+        self.assertEqual(len(result), 3)
+        self.assertFalse(any(c.startswith('__index_level_') for c in result.columns))
+
+    def test_batch_load_data_empty(self):
+        result = self.storage.batch_load_data(self.time_range, sources=['missing'])
+        self.assertTrue(result.empty)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import pandas as pd
+import torch
+from tokenizers import Tokenizer
+from tokenizers.models import WordLevel
+from tokenizers.pre_tokenizers import Whitespace
+from transformers import PreTrainedTokenizerFast, RobertaConfig, RobertaForSequenceClassification
+from pipelines.training import DistillationTrainer, distill, format_report
+from services.analysis import SentimentAnalyzer
+
+LABELS = ['positive', 'negative', 'neutral', 'sarcasm', 'frustration']
+WORDS = "great love terrible hate fine okay oh sure another outage why broken again".split()
+
+def save_tiny_teacher(directory: Path):
+    """Offline 4-layer RoBERTa teacher with a word-level tokenizer"""
+    vocab = {tok: i for i, tok in enumerate(['<s>', '<pad>', '</s>', '<unk>'] + WORDS)}
+    backend = Tokenizer(WordLevel(vocab, unk_token='<unk>'))
+    backend.pre_tokenizer = Whitespace()
+    tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=backend,
+        bos_token='<s>', eos_token='</s>', pad_token='<pad>', unk_token='<unk>'
+    )
+    config = RobertaConfig(
+        vocab_size=len(vocab),
+        hidden_size=32,
+        num_hidden_layers=4,
+        num_attention_heads=2,
+        intermediate_size=64,
+        max_position_embeddings=40,
+        pad_token_id=1,
+        num_labels=len(LABELS),
+        id2label=dict(enumerate(LABELS)),
+        label2id={label: i for i, label in enumerate(LABELS)}
+    )
+    torch.manual_seed(0)
+    RobertaForSequenceClassification(config).save_pretrained(directory)
+    tokenizer.save_pretrained(directory)
+
+def write_corpus(directory: Path, frames):
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, df in frames.items():
+        df.to_parquet(directory / name, engine='pyarrow')
+
+class TestDistillationTrainer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.teacher_dir = Path(cls.tmp.name) / 'teacher'
+        save_tiny_teacher(cls.teacher_dir)
+        cls.texts = [
+            "great love", "terrible hate", "fine okay", "oh sure great",
+            "another outage why", "broken again why", "love great great", "hate broken"
+        ] * 4
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.trainer = DistillationTrainer(self.teacher_dir, num_layers=2, max_length=16)
+
+    def test_build_student_copies_teacher_layers(self):
+        student = self.trainer.student
+        teacher = self.trainer.teacher
+        self.assertEqual(student.config.num_hidden_layers, 2)
+        # Evenly spaced: teacher layers 0 and 3
+        self.assertTrue(torch.equal(
+            student.roberta.encoder.layer[1].output.dense.weight,
+            teacher.roberta.encoder.layer[3].output.dense.weight
+        ))
+        with self.assertRaises(ValueError):
+            self.trainer.build_student(5)
+
+    def test_soft_labels(self):
+        probs = self.trainer.soft_labels(self.texts[:4])
+        self.assertEqual(probs.shape, (4, len(LABELS)))
+        self.assertTrue(torch.allclose(probs.sum(dim=-1), torch.ones(4)))
+
+    def test_train_reduces_loss(self):
+        history = self.trainer.train(self.texts, epochs=5, batch_size=8, learning_rate=1e-3)
+        self.assertEqual(len(history), 5)
+        self.assertLess(history[-1], history[0])
+
+    def test_evaluate(self):
+        report = self.trainer.evaluate(self.texts)
+        self.assertTrue(0.0 <= report['agreement'] <= 1.0)
+        self.assertEqual(set(report['per_class']), set(LABELS))
+        self.assertEqual(sum(c['support'] for c in report['per_class'].values()), len(self.texts))
+        self.assertLess(report['student_params'], report['teacher_params'])
+
+    def _patched_storage(self, root: Path):
+        return patch.multiple(
+            'services.storage',
+            RAW_DATA_DIR=root / 'raw',
+            PROCESSED_DATA_DIR=root / 'processed'
+        )
+
+    def test_load_corpus(self):
+        root = Path(self.tmp.name) / 'corpus'
+        write_corpus(root / 'processed', {
+            'reddit_sentiment_20240101_120000.parquet': pd.DataFrame({
+                'text': ['Great!!', 'Terrible...'],
+                'cleaned_text': ['great', 'terrible'],
+                'sentiment': ['positive', 'negative']
+            }),
+            'twitter_sentiment_20240102_080000.parquet': pd.DataFrame({
+                'text': ['Oh sure, another outage'],
+                'cleaned_text': ['oh sure another outage'],
+                'sentiment': ['sarcasm']
+            })
+        })
+        with self._patched_storage(root):
+            texts = self.trainer.load_corpus()
+            reddit = self.trainer.load_corpus(['reddit'])
+        self.assertEqual(sorted(texts), ['great', 'oh sure another outage', 'terrible'])
+        self.assertEqual(sorted(reddit), ['great', 'terrible'])
+
+    def test_load_corpus_falls_back_to_text(self):
+        root = Path(self.tmp.name) / 'raw_corpus'
+        write_corpus(root / 'processed', {
+            'reddit_sentiment_20240101_120000.parquet': pd.DataFrame({
+                'text': ['fine okay'], 'sentiment': ['neutral']
+            })
+        })
+        with self._patched_storage(root), self.assertLogs('pipelines.training', 'WARNING'):
+            self.assertEqual(self.trainer.load_corpus(), ['fine okay'])
+
+    def test_load_corpus_mixed_files(self):
+        root = Path(self.tmp.name) / 'mixed_corpus'
+        write_corpus(root / 'processed', {
+            'reddit_sentiment_20240101_120000.parquet': pd.DataFrame({
+                'text': ['Great!!', 'Terrible...'],
+                'cleaned_text': ['great', 'terrible']
+            }),
+            'twitter_sentiment_20240102_080000.parquet': pd.DataFrame({
+                'text': ['why broken again']
+            })
+        })
+        with self._patched_storage(root), self.assertLogs('pipelines.training', 'WARNING') as logs:
+            texts = self.trainer.load_corpus()
+        # cleaned_text is kept wherever a file has it
+        self.assertEqual(sorted(texts), ['great', 'terrible', 'why broken again'])
+        self.assertIn('1 of 3', logs.output[0])
+        self.assertIn('twitter', logs.output[0])
+
+    def test_distill(self):
+        root = Path(self.tmp.name) / 'distill'
+        write_corpus(root / 'processed', {
+            'reddit_sentiment_20240101_120000.parquet': pd.DataFrame({
+                'cleaned_text': self.texts
+            })
+        })
+        with self._patched_storage(root):
+            report = distill(root / 'student', self.teacher_dir, epochs=1, batch_size=8)
+        # 20% of 32 texts held out for evaluation
+        self.assertEqual(sum(c['support'] for c in report['per_class'].values()), 6)
+        self.assertTrue((root / 'student' / 'config.json').exists())
+
+        table = format_report(report)
+        self.assertIn('sarcasm', table)
+        self.assertIn('frustration', table)
+
+    def test_student_loads_in_sentiment_analyzer(self):
+        student_dir = self.trainer.save_student(Path(self.tmp.name) / 'student')
+        analyzer = SentimentAnalyzer(model_name=str(student_dir), max_length=16)
+        result = analyzer.get_top_sentiment("oh sure another outage")
+        self.assertIn(result['label'], LABELS)
+
+    def test_sentiment_model_setting_selects_student(self):
+        student_dir = str(self.trainer.save_student(Path(self.tmp.name) / 'student_setting'))
+        with patch('services.analysis.SENTIMENT_MODEL', student_dir):
+            analyzer = SentimentAnalyzer(max_length=16)
+        self.assertEqual(analyzer.model_name, student_dir)
+        self.assertEqual(analyzer.model.config.num_hidden_layers, 2)
+
+if __name__ == '__main__':
+    unittest.main()